@@ -6,27 +6,66 @@ This file wraps the Terminal-Bench evaluation logic for AgentBeats platform.
 The core harness logic is maintained in src/green_agent/green_agent.py
 """
 
-import json
+import asyncio
+import functools
 import sys
 import logging
 from pathlib import Path
-import requests
-from datetime import datetime
+import httpx
+import orjson
+from datetime import datetime, timezone
 
 import agentbeats as ab
 
-# Add parent directories to path for imports
+# Add the scenario root to path so `src.*` and `white_agent.*` resolve;
+# every import goes through those package prefixes, so one entry is enough
 _repo_root = Path(__file__).resolve().parent.parent.parent
 if str(_repo_root) not in sys.path:
     sys.path.insert(0, str(_repo_root))
-if str(_repo_root / "src") not in sys.path:
-    sys.path.insert(0, str(_repo_root / "src"))
 
 from src.green_agent.green_agent import TerminalBenchGreenAgentExecutor
 from src.config.settings import settings, ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+# Shared client so repeated battle reports reuse pooled backend connections
+_backend_client: httpx.AsyncClient | None = None
+
+
+def _get_backend_client() -> httpx.AsyncClient:
+    """Return the shared client used to report battle results."""
+    global _backend_client
+    if _backend_client is None:
+        _backend_client = httpx.AsyncClient(
+            timeout=10, limits=httpx.Limits(max_keepalive_connections=16)
+        )
+    return _backend_client
+
+
+@functools.lru_cache(maxsize=1)
+def _get_default_task_config() -> dict:
+    """Default task_config from config.toml, resolved once per process."""
+    try:
+        return {
+            "task_ids": settings.eval_task_ids,
+            "dataset_name": settings.dataset_name,
+            "dataset_version": settings.dataset_version,
+            "n_attempts": settings.eval_n_attempts,
+            "n_concurrent_trials": settings.eval_n_concurrent_trials,
+            "timeout_multiplier": settings.eval_timeout_multiplier,
+        }
+    except ConfigurationError:
+        # Fallback if config.toml is not found or has errors
+        logger.warning("Could not load config.toml, using fallback defaults")
+        return {
+            "task_ids": ["hello-world"],
+            "dataset_name": "terminal-bench-core",
+            "dataset_version": "0.1.1",
+            "n_attempts": 1,
+            "n_concurrent_trials": 1,
+            "timeout_multiplier": 1.0,
+        }
+
 
 @ab.tool
 async def start_terminal_bench_battle(battle_start_json: str) -> str:
@@ -43,12 +82,12 @@ async def start_terminal_bench_battle(battle_start_json: str) -> str:
         - Returns a compact JSON result string
     """
     try:
-        data = json.loads(battle_start_json)
+        data = orjson.loads(battle_start_json)
     except Exception as e:
-        return json.dumps({"ok": False, "error": f"invalid_json: {str(e)}"})
+        return orjson.dumps({"ok": False, "error": f"invalid_json: {str(e)}"}).decode()
 
     if data.get("type") != "battle_start":
-        return json.dumps({"ok": False, "error": "not_battle_start"})
+        return orjson.dumps({"ok": False, "error": "not_battle_start"}).decode()
 
     try:
         battle_id = data["battle_id"]
@@ -65,35 +104,16 @@ async def start_terminal_bench_battle(battle_start_json: str) -> str:
         # Get participant URL
         red_ctx_map = data.get("red_battle_contexts", {})
         if red_ctx_map:
-            white_agent_url = next(iter(red_ctx_map.keys()))
+            white_agent_url = next(iter(red_ctx_map))
         else:
             opps = data.get("opponent_infos", [])
             white_agent_url = opps[0]["agent_url"] if opps else None
 
         if not white_agent_url:
-            return json.dumps({"ok": False, "error": "no_participant_agent_url"})
+            return orjson.dumps({"ok": False, "error": "no_participant_agent_url"}).decode()
 
         # Parse task_config with sensible defaults from config.toml
-        try:
-            default_task_config = {
-                "task_ids": settings.eval_task_ids,
-                "dataset_name": settings.dataset_name,
-                "dataset_version": settings.dataset_version,
-                "n_attempts": settings.eval_n_attempts,
-                "n_concurrent_trials": settings.eval_n_concurrent_trials,
-                "timeout_multiplier": settings.eval_timeout_multiplier,
-            }
-        except ConfigurationError:
-            # Fallback if config.toml is not found or has errors
-            logger.warning("Could not load config.toml, using fallback defaults")
-            default_task_config = {
-                "task_ids": ["hello-world"],
-                "dataset_name": "terminal-bench-core",
-                "dataset_version": "0.1.1",
-                "n_attempts": 1,
-                "n_concurrent_trials": 1,
-                "timeout_multiplier": 1.0,
-            }
+        default_task_config = _get_default_task_config()
 
         # Extract task_config from battle payload
         raw_task_config = green_ctx.get("task_config", "")
@@ -108,8 +128,8 @@ async def start_terminal_bench_battle(battle_start_json: str) -> str:
             # Try to parse as JSON
             if raw_str:
                 try:
-                    parsed_config = json.loads(raw_str)
-                except json.JSONDecodeError:
+                    parsed_config = orjson.loads(raw_str)
+                except orjson.JSONDecodeError:
                     # If parsing fails, use defaults
                     parsed_config = {}
         elif isinstance(raw_task_config, dict):
@@ -133,9 +153,12 @@ async def start_terminal_bench_battle(battle_start_json: str) -> str:
             "timeout_multiplier": task_config["timeout_multiplier"],
         }
 
-        # Run the Terminal-Bench evaluation
+        # Run the Terminal-Bench evaluation off the event loop; the harness
+        # already fans task_ids out across n_concurrent_trials workers
         executor = TerminalBenchGreenAgentExecutor()
-        results = executor.run_terminal_bench_evaluation(eval_config)
+        results = await asyncio.to_thread(
+            executor.run_terminal_bench_evaluation, eval_config
+        )
 
         # Format detailed results
         results_message = executor.format_results_message(results, eval_config)
@@ -145,7 +168,7 @@ async def start_terminal_bench_battle(battle_start_json: str) -> str:
             result_data = {
                 "is_result": True,
                 "message": "Terminal-Bench evaluation completed",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
                 "reported_by": "Terminal-Bench Green Agent",
                 "detail": {
                     "accuracy": results.accuracy,
@@ -157,23 +180,22 @@ async def start_terminal_bench_battle(battle_start_json: str) -> str:
                 "markdown_content": results_message,
             }
             
-            response = requests.post(
+            response = await _get_backend_client().post(
                 f"{actual_backend_url}/battles/{battle_id}",
-                json=result_data,
+                content=orjson.dumps(result_data),
                 headers={"Content-Type": "application/json"},
-                timeout=10
             )
             
             if response.status_code == 204:
-                print(f"[Terminal-Bench] Successfully reported battle result")
+                logger.info("Successfully reported battle result")
             else:
-                print(f"[Terminal-Bench] Failed to report battle result: {response.text}")
+                logger.warning("Failed to report battle result: %s", response.text)
                 
         except Exception as report_error:
-            print(f"[Warning] Failed to report battle end: {report_error}")
+            logger.warning("Failed to report battle end: %s", report_error)
             # Continue even if reporting fails
 
-        return json.dumps({
+        return orjson.dumps({
             "ok": True,
             "battle_id": battle_id,
             "backend_url": actual_backend_url,
@@ -181,10 +203,10 @@ async def start_terminal_bench_battle(battle_start_json: str) -> str:
             "accuracy": results.accuracy,
             "n_resolved": results.n_resolved,
             "n_unresolved": results.n_unresolved,
-        })
+        }).decode()
 
     except Exception as e:
         error_msg = f"Error during evaluation: {str(e)}"
         logger.error(error_msg, exc_info=True)
-        return json.dumps({"ok": False, "error": error_msg})
+        return orjson.dumps({"ok": False, "error": error_msg}).decode()
 
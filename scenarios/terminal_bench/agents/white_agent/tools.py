@@ -6,23 +6,25 @@ This file wraps the Terminal-Bench white agent logic for AgentBeats platform.
 The core task-solving logic is maintained in white_agent/white_agent_helpers.py
 """
 
-import re
 import sys
 import logging
 from pathlib import Path
 
 import agentbeats as ab
 
-# Add parent directories to path for imports
+# Add the scenario root to path so `src.*` and `white_agent.*` resolve;
+# every import goes through those package prefixes, so one entry is enough
 _repo_root = Path(__file__).resolve().parent.parent.parent
 if str(_repo_root) not in sys.path:
     sys.path.insert(0, str(_repo_root))
-if str(_repo_root / "src") not in sys.path:
-    sys.path.insert(0, str(_repo_root / "src"))
 
-from white_agent.white_agent_helpers import connect_to_mcp, solve_task_with_llm_and_mcp
+from white_agent.white_agent_helpers import (
+    MCP_URL_RE,
+    connect_to_mcp,
+    get_openai_client,
+    solve_task_with_llm_and_mcp,
+)
 from src.config import settings
-from openai import OpenAI
 
 logger = logging.getLogger(__name__)
 
@@ -52,15 +54,15 @@ async def solve_terminal_bench_task(task_message: str) -> str:
         A string describing the task completion status and results
     """
     # Extract MCP server URL from user input
-    mcp_match = re.search(r"MCP Server URL: (.+)", task_message)
+    mcp_match = MCP_URL_RE.search(task_message)
     if not mcp_match:
         return "Error: MCP Server URL not found in task message. Expected format: 'MCP Server URL: [url]'"
     
-    mcp_url = mcp_match.group(1).strip()
+    mcp_url = mcp_match.group(1)
     logger.info(f"Connecting to MCP server: {mcp_url}")
     
-    # Initialize OpenAI client
-    client = OpenAI(api_key=settings.openai_api_key)
+    # Shared per event loop, so concurrent tasks reuse its connections
+    client = get_openai_client(settings.openai_api_key)
     model = settings.white_agent_model
     
     try:
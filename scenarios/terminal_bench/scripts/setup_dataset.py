@@ -6,12 +6,17 @@ import sys
 from pathlib import Path
 
 DATASET = "terminal-bench-core"
+CACHE_DIR = Path.home() / ".cache" / "terminal-bench" / DATASET
+COMPLETE_MARKER = CACHE_DIR / ".complete"
 
 
 def main():
-    # Check if dataset already exists
-    cache_dir = Path.home() / ".cache" / "terminal-bench" / DATASET
-    if cache_dir.exists() and any(cache_dir.iterdir()):
+    # Check if dataset already exists (marker written after a successful download)
+    if COMPLETE_MARKER.exists():
+        print(f"✅ Dataset '{DATASET}' already downloaded")
+        return 0
+    if CACHE_DIR.exists() and any(CACHE_DIR.iterdir()):
+        COMPLETE_MARKER.touch()
         print(f"✅ Dataset '{DATASET}' already downloaded")
         return 0
 
@@ -21,7 +26,10 @@ def main():
         subprocess.run(
             ["terminal-bench", "datasets", "download", "--dataset", DATASET],
             check=True,
+            stdout=subprocess.DEVNULL,
         )
+        COMPLETE_MARKER.parent.mkdir(parents=True, exist_ok=True)
+        COMPLETE_MARKER.touch()
         print(f"✅ Dataset downloaded successfully")
         return 0
     except FileNotFoundError:
@@ -2,8 +2,7 @@
 Entry point for running kickoff script as a module.
 """
 
-import asyncio
-from src.kickoff import main
+from src.kickoff import run
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
@@ -1,10 +1,11 @@
 """A2A adapter for terminal-bench that creates task-scoped MCP servers."""
 
 import asyncio
+import itertools
 import logging
-import time
-import threading
+import socket
 from pathlib import Path
+from typing import Iterator
 
 from terminal_bench.agents.base_agent import BaseAgent, AgentResult
 from terminal_bench.agents.failure_mode import FailureMode
@@ -12,24 +13,37 @@ from terminal_bench.terminal.tmux_session import TmuxSession
 
 from src.config import settings
 from src.green_agent.task_mcp_server import create_task_mcp_server
-from src.utils.a2a_client import send_message_to_agent
+from src.utils.a2a_client import close_clients, send_message_to_agent
 
 logger = logging.getLogger(__name__)
 
+_PORT_PROBE_ATTEMPTS = 50
+
+_MSG_TEMPLATE = """You are being evaluated on Terminal-Bench.
+
+TASK: {instruction}
+
+MCP Server URL: {mcp_url}
+
+ENVIRONMENT:
+- Tool: execute_bash_command (parameter: command)
+- Working Dir: /app (inside Docker container)
+
+Connect to MCP, execute bash commands to complete the task."""
+
 
 class A2AAdapter(BaseAgent):
     """Terminal-bench adapter that communicates with A2A agent via MCP."""
 
-    _next_port = None
-    _port_lock = None
+    # Shared across instances; next() on itertools.count is atomic under the GIL
+    _port_iter: Iterator[int] | None = None
 
     def __init__(self, agent_url: str, **kwargs):
         self.agent_url = agent_url
         self.mcp_base_port = kwargs.get("mcp_base_port", settings.mcp_base_port)
 
-        if A2AAdapter._next_port is None:
-            A2AAdapter._next_port = self.mcp_base_port
-            A2AAdapter._port_lock = threading.Lock()
+        if A2AAdapter._port_iter is None:
+            A2AAdapter._port_iter = itertools.count(self.mcp_base_port)
 
         logger.info(
             f"A2AAdapter initialized: {agent_url}, MCP port: {self.mcp_base_port}"
@@ -39,19 +53,29 @@ class A2AAdapter(BaseAgent):
     def name(cls) -> str:
         return "a2a-agent"
 
+    @classmethod
+    def _next_free_port(cls) -> int:
+        """Take ports from the shared counter until one can actually be bound."""
+        for _ in range(_PORT_PROBE_ATTEMPTS):
+            port = next(cls._port_iter)
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                # Match uvicorn, which also binds with SO_REUSEADDR
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                try:
+                    sock.bind(("0.0.0.0", port))
+                except OSError:
+                    logger.warning(f"MCP port {port} in use, trying next")
+                    continue
+            return port
+        raise RuntimeError(
+            f"No free MCP port found after {_PORT_PROBE_ATTEMPTS} attempts"
+        )
+
     def _format_message(self, instruction: str, mcp_url: str) -> str:
         """Format task instruction with MCP details."""
-        return f"""You are being evaluated on Terminal-Bench.
-
-TASK: {instruction}
-
-MCP Server URL: {mcp_url}
-
-ENVIRONMENT:
-- Tool: execute_bash_command (parameter: command)
-- Working Dir: /app (inside Docker container)
-
-Connect to MCP, execute bash commands to complete the task."""
+        return _MSG_TEMPLATE.format_map(
+            {"instruction": instruction, "mcp_url": mcp_url}
+        )
 
     async def _send_to_agent(self, message: str) -> str:
         """Send message to A2A agent."""
@@ -63,6 +87,9 @@ Connect to MCP, execute bash commands to complete the task."""
         except Exception as e:
             logger.error(f"Agent error: {e}")
             return f"Error: {str(e)}"
+        finally:
+            # Each task runs on its own event loop; release its pooled client
+            await close_clients()
 
     def perform_task(
         self, instruction: str, session: TmuxSession, logging_dir: Path
@@ -70,10 +97,8 @@ Connect to MCP, execute bash commands to complete the task."""
         """Perform task by creating MCP server and sending to A2A agent."""
         container = session.container.name
 
-        # Allocate unique port for this task
-        with A2AAdapter._port_lock:
-            port = A2AAdapter._next_port
-            A2AAdapter._next_port += 1
+        # Allocate unique, currently free port for this task
+        port = self._next_free_port()
 
         mcp_url = f"http://localhost:{port}"
         logger.info(f"Task: {container} on port {port}")
@@ -85,11 +110,8 @@ Connect to MCP, execute bash commands to complete the task."""
             mcp_server.start()
 
             # Wait for server to be ready
-            for i in range(20):
-                if mcp_server.is_ready():
-                    time.sleep(1.0)  # Extra wait for SSE endpoint
-                    break
-                time.sleep(0.5)
+            if not mcp_server.wait_until_ready(timeout=10.0):
+                logger.warning(f"MCP server on port {port} not ready after 10s")
 
             # Send task to agent
             message = self._format_message(instruction, mcp_url)
@@ -98,10 +120,13 @@ Connect to MCP, execute bash commands to complete the task."""
             # Log interaction
             log_file = logging_dir / "agent_interaction.log"
             log_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(log_file, "a") as f:
-                f.write(f"\n{'='*80}\nMCP: {mcp_url} | Container: {container}\n")
-                f.write(f"INSTRUCTION:\n{message}\n{'-'*80}\n")
-                f.write(f"RESPONSE:\n{response}\n{'='*80}\n")
+            entry = (
+                f"\n{'='*80}\nMCP: {mcp_url} | Container: {container}\n"
+                f"INSTRUCTION:\n{message}\n{'-'*80}\n"
+                f"RESPONSE:\n{response}\n{'='*80}\n"
+            )
+            with open(log_file, "a", encoding="utf-8") as f:
+                f.write(entry)
 
             # Check for errors
             failure = (
@@ -1,6 +1,8 @@
 """Config loader for terminal-bench green agent."""
 
+import functools
 import os
+import sys
 import tomllib
 from pathlib import Path
 from typing import Any
@@ -14,8 +16,25 @@ class ConfigurationError(Exception):
     pass
 
 
+def _env_key(key: str) -> str:
+    """Environment variable name overriding a dotted config key."""
+    return key.upper().replace(".", "_")
+
+
+def _flatten(prefix: str, table: dict[str, Any], out: dict[str, Any]) -> None:
+    """Record every nested table and value under its dotted key path."""
+    for k, v in table.items():
+        key = f"{prefix}{k}"
+        out[key] = v
+        if isinstance(v, dict):
+            _flatten(f"{key}.", v, out)
+
+
 class Settings:
-    """Load config from config.toml and environment variables."""
+    """Load config from config.toml and environment variables.
+
+    Typed values are resolved on first access and cached on the instance.
+    """
 
     def __init__(self, config_path: Path | None = None):
         if config_path is None:
@@ -30,22 +49,20 @@ class Settings:
         except tomllib.TOMLDecodeError as e:
             raise ConfigurationError(f"Invalid TOML syntax: {e}") from e
 
+        # Dotted key -> value for every table and leaf, plus its env var name
+        self._flat: dict[str, Any] = {}
+        _flatten("", self._config, self._flat)
+        self._env_keys = {key: _env_key(key) for key in self._flat}
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get config value (env vars override TOML)."""
         # Check environment variable first
-        env_val = os.getenv(key.upper().replace(".", "_"))
+        env_val = os.environ.get(self._env_keys.get(key) or _env_key(key))
         if env_val is not None:
             return env_val
 
         # Get from TOML config
-        value = self._config
-        for k in key.split("."):
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
-            if value is None:
-                return default
+        value = self._flat.get(key)
         return value if value is not None else default
 
     def _required(self, key: str) -> Any:
@@ -55,108 +72,109 @@ class Settings:
             raise ConfigurationError(f"Missing required config: {key}")
         return value
 
-    @property
+    @functools.cached_property
     def openai_api_key(self) -> str | None:
         return os.getenv("OPENAI_API_KEY")
 
-    @property
+    @functools.cached_property
     def green_agent_host(self) -> str:
         return self._required("green_agent.host")
 
-    @property
+    @functools.cached_property
     def green_agent_port(self) -> int:
         return int(self._required("green_agent.port"))
 
-    @property
+    @functools.cached_property
     def green_agent_card_path(self) -> str:
         return self._required("green_agent.card_path")
 
-    @property
+    @functools.cached_property
     def mcp_base_port(self) -> int:
         return int(self._required("mcp.base_port"))
 
-    @property
+    @functools.cached_property
     def white_agent_host(self) -> str:
         return self._required("white_agent.host")
 
-    @property
+    @functools.cached_property
     def white_agent_port(self) -> int:
         return int(self._required("white_agent.port"))
 
-    @property
+    @functools.cached_property
     def white_agent_model(self) -> str:
         return self._required("white_agent.model")
 
-    @property
+    @functools.cached_property
     def white_agent_url(self) -> str:
         return f"http://{self.white_agent_host}:{self.white_agent_port}"
 
-    @property
+    @functools.cached_property
     def agent_max_iterations(self) -> int:
         return int(self._required("white_agent.max_iterations"))
 
-    @property
+    @functools.cached_property
     def eval_output_path(self) -> str:
         return self._required("evaluation.output_path")
 
-    @property
+    @functools.cached_property
     def eval_n_attempts(self) -> int:
         return int(self._required("evaluation.n_attempts"))
 
-    @property
+    @functools.cached_property
     def eval_n_concurrent_trials(self) -> int:
         return int(self._required("evaluation.n_concurrent_trials"))
 
-    @property
+    @functools.cached_property
     def eval_timeout_multiplier(self) -> float:
         return float(self._required("evaluation.timeout_multiplier"))
 
-    @property
+    @functools.cached_property
     def eval_cleanup(self) -> bool:
         return bool(self._required("evaluation.cleanup"))
 
-    @property
+    @functools.cached_property
     def eval_task_ids(self) -> list[str]:
         task_ids = self._required("evaluation.task_ids")
         if isinstance(task_ids, str):
             return [t.strip() for t in task_ids.split(",")]
         return task_ids
 
-    @property
+    @functools.cached_property
     def dataset_name(self) -> str:
         return self._required("dataset.name")
 
-    @property
+    @functools.cached_property
     def dataset_version(self) -> str:
         return self._required("dataset.version")
 
-    @property
+    @functools.cached_property
     def log_level(self) -> str:
         return self._required("logging.level")
 
-    @property
+    @functools.cached_property
     def log_format(self) -> str:
         return self._required("logging.format")
 
-    @property
+    @functools.cached_property
     def a2a_message_timeout(self) -> float:
         return float(self._required("a2a.message_timeout"))
 
-    @property
+    @functools.cached_property
     def a2a_health_check_timeout(self) -> float:
         return float(self._required("a2a.health_check_timeout"))
 
-    @property
+    @functools.cached_property
     def difficulty_weights(self) -> dict[str, int]:
         """Get difficulty weights for scoring."""
         weights = self._required("scoring.difficulty_weights")
-        return weights
+        return {sys.intern(k): int(v) for k, v in weights.items()}
 
-    @property
+    @functools.cached_property
     def task_difficulty_map(self) -> dict[str, str]:
         """Get task difficulty mapping for scoring."""
         task_map = self._required("scoring.task_difficulty_map")
-        return task_map
+        # Interned keys and values: scoring looks these up once per task result
+        return {sys.intern(k): sys.intern(v) for k, v in task_map.items()}
 
 
 settings = Settings()
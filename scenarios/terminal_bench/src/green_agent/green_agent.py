@@ -3,10 +3,11 @@ Green Agent for evaluating other agents on terminal-bench.
 This agent receives evaluation requests via A2A protocol and runs terminal-bench harness.
 """
 
-import json
+import asyncio
 import logging
 import re
 import tomllib
+import orjson
 import uvicorn
 from datetime import datetime
 from pathlib import Path
@@ -29,6 +30,8 @@ from src.config.settings import ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+_TASK_CONFIG_RE = re.compile(r"<task_config>(.*?)</task_config>", re.DOTALL)
+
 
 class TerminalBenchGreenAgentExecutor(AgentExecutor):
     """
@@ -42,16 +45,19 @@ class TerminalBenchGreenAgentExecutor(AgentExecutor):
     def parse_task_config(self, user_input: str) -> dict[str, Any]:
         """
         Parse task configuration from user input.
-        Extracts JSON config from <task_config> tags.
+        Accepts a bare JSON payload or JSON wrapped in <task_config> tags.
         """
-        match = re.search(r"<task_config>(.*?)</task_config>", user_input, re.DOTALL)
-        if match:
-            config_json = match.group(1).strip()
-            return json.loads(config_json)
+        # Structured payloads skip the tag scan entirely
         try:
-            return json.loads(user_input)
-        except json.JSONDecodeError:
+            return orjson.loads(user_input)
+        except orjson.JSONDecodeError:
+            pass
+
+        match = _TASK_CONFIG_RE.search(user_input)
+        if not match:
             raise ValueError("Could not parse task configuration from user input")
+        config_json = match.group(1).strip()
+        return orjson.loads(config_json)
 
     def run_terminal_bench_evaluation(self, config: dict[str, Any]) -> BenchmarkResults:
         """
@@ -148,8 +154,8 @@ class TerminalBenchGreenAgentExecutor(AgentExecutor):
                     results_json_path = trial_dir / "results.json"
 
                     if results_json_path.exists():
-                        with open(results_json_path, "r") as f:
-                            trial_data = json.load(f)
+                        with open(results_json_path, "rb") as f:
+                            trial_data = orjson.loads(f.read())
 
                         if "parser_results" in trial_data and isinstance(
                             trial_data["parser_results"], dict
@@ -352,8 +358,11 @@ Scores by Difficulty (Unweighted Avg):
                 ),
             )
 
-            # Run terminal-bench evaluation
-            results = self.run_terminal_bench_evaluation(task_config)
+            # Run terminal-bench evaluation in a worker thread so the A2A
+            # server keeps serving while the harness runs
+            results = await asyncio.to_thread(
+                self.run_terminal_bench_evaluation, task_config
+            )
 
             # Store in history
             self.evaluation_history.append(
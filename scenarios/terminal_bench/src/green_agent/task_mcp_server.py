@@ -1,14 +1,16 @@
 """Task-scoped MCP server for terminal-bench Docker containers."""
-"""We start and stop the server for each task."""
+"""We start and stop the server for each task; all servers share one event loop."""
 
 import asyncio
-import json
 import logging
-import socket
+import shlex
 import threading
 import time
+from concurrent.futures import Future
 from typing import Any
+from uuid import uuid4
 
+import orjson
 import uvicorn
 from mcp.server import Server
 from mcp.server.sse import SseServerTransport
@@ -21,6 +23,89 @@ from starlette.routing import Mount, Route
 logger = logging.getLogger(__name__)
 
 
+# Bytes kept per output stream: the first and last half of this are returned
+_OUTPUT_CAP = 1024 * 1024
+
+
+class _FramedOutput:
+    """One command's output on a persistent shell stream, up to its marker.
+
+    Collects what is written before the marker line (without the newline the
+    framing adds in front of it) and the rest of the marker line. Output
+    beyond `cap` bytes keeps its head and tail; the middle is replaced with
+    a truncation notice.
+    """
+
+    def __init__(self, marker: bytes, cap: int = _OUTPUT_CAP):
+        self.sep = b"\n" + marker
+        self.half = cap // 2
+        self.cap = cap
+        self.head: bytes | None = None
+        self.dropped = 0
+        self.buf = bytearray()
+        self.search_from = 0
+        self.done: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def feed(self, chunk: bytes) -> bool:
+        """Add a chunk read from the stream; return True once framed."""
+        buf, sep = self.buf, self.sep
+        buf.extend(chunk)
+        idx = buf.find(sep, self.search_from)
+        if idx != -1:
+            end = buf.find(b"\n", idx + len(sep))
+            if end == -1:
+                return False
+            status = bytes(buf[idx + len(sep) : end]).strip()
+            del buf[idx:]
+            self._cap()
+            out = bytes(buf)
+            if self.head is not None:
+                notice = f"\n...[{self.dropped} bytes truncated]...\n".encode()
+                out = self.head + notice + out
+            self.done.set_result((out, status))
+            return True
+        self._cap()
+        self.search_from = max(0, len(buf) - len(sep))
+        return False
+
+    def _cap(self):
+        """Once past `cap`, keep the first half and only the latest half."""
+        buf = self.buf
+        if self.head is None and len(buf) > self.cap:
+            self.head = bytes(buf[: self.half])
+            del buf[: self.half]
+        if self.head is not None and len(buf) > self.half:
+            excess = len(buf) - self.half
+            del buf[:excess]
+            self.dropped += excess
+
+    def fail(self, exc: BaseException):
+        if not self.done.done():
+            self.done.set_exception(exc)
+
+
+class MCPHub:
+    """One background event loop shared by all task-scoped MCP servers."""
+
+    _instance: "MCPHub | None" = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, daemon=True, name="MCP-hub"
+        )
+        self.thread.start()
+
+    @classmethod
+    def get(cls) -> "MCPHub":
+        """Return the process-wide hub, starting its loop on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+
 class TaskMCPServer:
     """MCP server bound to a specific Docker container."""
 
@@ -30,28 +115,37 @@ class TaskMCPServer:
         self.server = Server(f"terminal-bench-task-{container_name}")
         self.sse_transport = SseServerTransport("/messages/")
         self.uvicorn_server = None
-        self.server_thread = None
+        self._serve_future: Future | None = None
+        self._shell: asyncio.subprocess.Process | None = None
+        self._shell_lock = asyncio.Lock()
+        # Readers draining the shell's stdout/stderr, and the command output
+        # each one is currently framing (None while the shell is idle)
+        self._pumps: list[asyncio.Task] = []
+        self._frames: list[_FramedOutput | None] = [None, None]
         self._setup_tools()
         logger.info(f"MCP server: {container_name} on port {port}")
 
     def _setup_tools(self):
         """Register execute_bash_command tool."""
+        # Responses that never change for this server are built once
+        tools = [
+            Tool(
+                name="execute_bash_command",
+                description=f"Execute bash command in container '{self.container_name}' at /app",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "command": {"type": "string", "description": "Bash command"}
+                    },
+                    "required": ["command"],
+                },
+            )
+        ]
+        err_no_command = [TextContent(type="text", text="Error: Command is required")]
 
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
-            return [
-                Tool(
-                    name="execute_bash_command",
-                    description=f"Execute bash command in container '{self.container_name}' at /app",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "command": {"type": "string", "description": "Bash command"}
-                        },
-                        "required": ["command"],
-                    },
-                )
-            ]
+            return tools
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
@@ -60,33 +154,87 @@ class TaskMCPServer:
 
             command = arguments.get("command")
             if not command:
-                return [TextContent(type="text", text="Error: Command is required")]
+                return err_no_command
 
             result = await self._execute_bash_command(command)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-    async def _execute_bash_command(self, command: str) -> dict[str, Any]:
-        """Execute bash command in Docker container."""
-        logger.info(f"Exec: {command}")
+            return [TextContent(type="text", text=orjson.dumps(result).decode())]
 
-        try:
-            process = await asyncio.create_subprocess_exec(
+    async def _get_shell(self) -> asyncio.subprocess.Process:
+        """Return the container's persistent bash shell, starting it if needed."""
+        if self._shell is None or self._shell.returncode is not None:
+            self._discard_shell()
+            self._shell = await asyncio.create_subprocess_exec(
                 "docker",
                 "exec",
+                "-i",
                 "-w",
                 "/app",
                 self.container_name,
                 "bash",
-                "-c",
-                command,
+                stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, stderr = await process.communicate()
+            # Background jobs inherit the shell's pipes, so both are drained
+            # for the shell's whole life: a chatty job never blocks on a full
+            # pipe, and what it writes between commands is dropped
+            self._pumps = [
+                asyncio.create_task(self._pump(self._shell.stdout, 0)),
+                asyncio.create_task(self._pump(self._shell.stderr, 1)),
+            ]
+        return self._shell
+
+    async def _pump(self, stream: asyncio.StreamReader, slot: int):
+        """Route one shell stream to the command being framed on it, if any."""
+        while chunk := await stream.read(64 * 1024):
+            frame = self._frames[slot]
+            if frame is not None and frame.feed(chunk):
+                self._frames[slot] = None
+        frame = self._frames[slot]
+        if frame is not None:
+            frame.fail(ConnectionError("Container shell exited unexpectedly"))
+            self._frames[slot] = None
+
+    def _discard_shell(self):
+        """Kill the persistent shell; the next command starts a fresh one."""
+        for pump in self._pumps:
+            pump.cancel()
+        self._pumps = []
+        self._frames = [None, None]
+        if self._shell and self._shell.returncode is None:
+            self._shell.kill()
+        self._shell = None
+
+    async def _execute_bash_command(self, command: str) -> dict[str, Any]:
+        """Execute bash command in Docker container."""
+        logger.info(f"Exec: {command}")
+
+        try:
+            async with self._shell_lock:
+                shell = await self._get_shell()
+                marker = f"__TB_END_{uuid4().hex}__"
+                frames = [_FramedOutput(marker.encode()) for _ in range(2)]
+                self._frames = list(frames)
+                # Each command runs in its own `bash -c` so cwd/env/exit do not
+                # leak between calls; the marker frames both output streams
+                shell.stdin.write(
+                    f"bash -c {shlex.quote(command)} </dev/null; "
+                    f"printf '\\n{marker} %d\\n' $?; "
+                    f"printf '\\n{marker}\\n' >&2\n".encode()
+                )
+                try:
+                    await shell.stdin.drain()
+                    (stdout, status), (stderr, _) = await asyncio.gather(
+                        frames[0].done, frames[1].done
+                    )
+                except BaseException:
+                    # The stream framing is lost if we stop mid-command
+                    self._discard_shell()
+                    raise
 
             return {
                 "command": command,
-                "returncode": process.returncode,
+                "returncode": int(status),
                 "stdout": stdout.decode("utf-8", errors="replace"),
                 "stderr": stderr.decode("utf-8", errors="replace"),
             }
@@ -119,39 +267,52 @@ class TaskMCPServer:
             ],
         )
 
+    async def _serve(self):
+        """Run uvicorn, containing the SystemExit it raises on startup failure."""
+        try:
+            await self.uvicorn_server.serve()
+        except SystemExit:
+            # Must not propagate: it would stop the shared hub loop
+            logger.error(f"MCP server on port {self.port} failed to start")
+        finally:
+            self._discard_shell()
+
     def start(self):
-        """Start MCP server in background thread."""
+        """Start MCP server on the shared hub event loop."""
         config = uvicorn.Config(
             self._create_app(), host="0.0.0.0", port=self.port, log_level="error"
         )
         self.uvicorn_server = uvicorn.Server(config)
 
-        self.server_thread = threading.Thread(
-            target=lambda: asyncio.run(self.uvicorn_server.serve()),
-            daemon=True,
-            name=f"MCP-{self.container_name}",
+        self._serve_future = asyncio.run_coroutine_threadsafe(
+            self._serve(), MCPHub.get().loop
         )
-        self.server_thread.start()
-        time.sleep(2.0)  # Wait for server to initialize
-        logger.info(f"MCP started on port {self.port}")
+        logger.info(f"MCP starting on port {self.port}")
 
     def shutdown(self):
         """Shutdown MCP server."""
         if self.uvicorn_server:
             self.uvicorn_server.should_exit = True
-            if self.server_thread:
-                self.server_thread.join(timeout=2.0)
+            if self._serve_future:
+                try:
+                    self._serve_future.result(timeout=2.0)
+                except Exception as e:
+                    logger.warning(f"MCP shutdown on port {self.port}: {e!r}")
             logger.info("MCP shutdown")
 
-    def is_ready(self) -> bool:
-        """Check if server is ready."""
-        if not self.uvicorn_server:
-            return False
-        try:
-            with socket.create_connection(("localhost", self.port), timeout=1.0):
+    def wait_until_ready(self, timeout: float = 10.0) -> bool:
+        """Block until uvicorn is listening, polling with exponential backoff."""
+        deadline = time.monotonic() + timeout
+        delay = 0.025
+        while time.monotonic() < deadline:
+            # uvicorn sets `started` only after its sockets are bound
+            if self.uvicorn_server and self.uvicorn_server.started:
                 return True
-        except (socket.error, socket.timeout):
-            return False
+            if self._serve_future and self._serve_future.done():
+                return False  # startup failed, e.g. port already in use
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+        return False
 
 
 def create_task_mcp_server(container_name: str, port: int) -> TaskMCPServer:
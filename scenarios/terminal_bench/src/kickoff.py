@@ -1,21 +1,25 @@
 """Kickoff script to send evaluation request to green agent."""
 
 import asyncio
-import json
 import sys
 import httpx
-from src.utils.a2a_client import send_message_to_agent
+import orjson
+from src.utils.a2a_client import close_clients, send_message_to_agent
 from src.config.settings import settings
 
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
 
-async def check_agent(url: str, name: str) -> bool:
+
+async def check_agent(client: httpx.AsyncClient, url: str, name: str) -> bool:
     """Check if agent is running."""
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{url}/.well-known/agent.json")
-            if response.status_code == 200:
-                print(f"✓ {name} running at {url}")
-                return True
+        response = await client.get(f"{url}/.well-known/agent.json")
+        if response.status_code == 200:
+            print(f"✓ {name} running at {url}")
+            return True
     except httpx.ConnectError:
         print(f"✗ {name} NOT running at {url}")
     except Exception as e:
@@ -23,6 +27,20 @@ async def check_agent(url: str, name: str) -> bool:
     return False
 
 
+def _build_message(task_config: dict) -> str:
+    """Build the evaluation request sent to the green agent."""
+    white_url = task_config["white_agent_url"]
+    config_json = orjson.dumps(task_config, option=orjson.OPT_INDENT_2).decode()
+    return f"""Launch terminal-bench evaluation for agent at {white_url}.
+
+Configuration:
+<task_config>
+{config_json}
+</task_config>
+
+Report results including tasks attempted, resolved, accuracy, and failure modes."""
+
+
 async def main():
     # Load config
     task_config = {
@@ -44,8 +62,11 @@ async def main():
     print("=" * 80)
     print("\nChecking agents...\n")
 
-    green_ok = await check_agent(green_url, "Green agent")
-    white_ok = await check_agent(white_url, "White agent")
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        green_ok, white_ok = await asyncio.gather(
+            check_agent(client, green_url, "Green agent"),
+            check_agent(client, white_url, "White agent"),
+        )
 
     if not green_ok:
         print("\nStart green agent: python -m src.green_agent")
@@ -62,16 +83,12 @@ async def main():
         f"{task_config['n_concurrent_trials']} concurrent\n"
     )
 
-    message = f"""Launch terminal-bench evaluation for agent at {white_url}.
+    message = _build_message(task_config)
 
-Configuration:
-<task_config>
-{json.dumps(task_config, indent=2)}
-</task_config>
-
-Report results including tasks attempted, resolved, accuracy, and failure modes."""
-
-    response = await send_message_to_agent(message, green_url)
+    try:
+        response = await send_message_to_agent(message, green_url)
+    finally:
+        await close_clients()
 
     print("=" * 80)
     print("GREEN AGENT RESPONSE:")
@@ -79,5 +96,16 @@ Report results including tasks attempted, resolved, accuracy, and failure modes.
     print(response)
 
 
-if __name__ == "__main__":
+def run():
+    """Run the kickoff on uvloop when available, stdlib asyncio otherwise."""
+    if uvloop is not None:
+        uvloop.run(main())
+        return
+    if sys.platform == "win32":
+        # The default Proactor loop burns idle CPU; kickoff needs no subprocesses
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
     asyncio.run(main())
+
+
+if __name__ == "__main__":
+    run()
@@ -6,10 +6,12 @@ from src.utils.a2a_client import (
     send_message_to_agent,
     check_agent_health,
     get_agent_card,
+    close_clients,
 )
 
 __all__ = [
     "send_message_to_agent",
     "check_agent_health",
     "get_agent_card",
+    "close_clients",
 ]
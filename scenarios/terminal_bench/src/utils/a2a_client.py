@@ -4,9 +4,12 @@ A2A Client Utilities
 Helper functions for communicating with A2A-compatible agents.
 """
 
+import asyncio
+import io
+import time
+import weakref
 import httpx
 from uuid import uuid4
-from typing import List
 
 from a2a.client import A2AClient, A2ACardResolver
 from a2a.types import (
@@ -24,6 +27,61 @@ from a2a.types import (
 
 from src.config import settings
 
+# Pooled HTTP clients, one per event loop: A2AAdapter drives each task
+# through its own asyncio.run(), and httpx connections cannot cross loops.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the pooled httpx client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_clients() -> None:
+    """Close the pooled httpx client bound to the running event loop."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+# Resolved agent cards keyed by agent URL, as (fetched_at, card)
+_CARD_TTL = 300.0
+_card_cache: dict[str, tuple[float, AgentCard]] = {}
+
+
+def _cached_card(agent_url: str) -> AgentCard | None:
+    """Return the cached agent card if it is still fresh."""
+    entry = _card_cache.get(agent_url)
+    if entry and time.monotonic() - entry[0] < _CARD_TTL:
+        return entry[1]
+    return None
+
+
+async def _fetch_card(
+    agent_url: str, timeout: float, relative_card_path: str | None = None
+) -> AgentCard | None:
+    """Fetch the agent card over HTTP and refresh the cache."""
+    resolver = A2ACardResolver(httpx_client=_get_client(), base_url=agent_url)
+    try:
+        card = await resolver.get_agent_card(
+            relative_card_path=relative_card_path, http_kwargs={"timeout": timeout}
+        )
+    except Exception:
+        _card_cache.pop(agent_url, None)
+        raise
+    if card is not None:
+        _card_cache[agent_url] = (time.monotonic(), card)
+    return card
+
 
 async def send_message_to_agent(
     message: str, agent_url: str, timeout: float | None = None
@@ -46,58 +104,61 @@ async def send_message_to_agent(
     if timeout is None:
         timeout = settings.a2a_message_timeout
 
-    httpx_client = None
-    try:
-        # Create A2A client
-        httpx_client = httpx.AsyncClient(timeout=timeout)
-        resolver = A2ACardResolver(httpx_client=httpx_client, base_url=agent_url)
-
-        card: AgentCard | None = await resolver.get_agent_card(
-            relative_card_path="/.well-known/agent.json"
-        )
+    # Create A2A client
+    card: AgentCard | None = _cached_card(agent_url) or await _fetch_card(
+        agent_url, timeout, relative_card_path="/.well-known/agent.json"
+    )
 
-        if card is None:
-            raise RuntimeError(f"Failed to resolve agent card from {agent_url}")
+    if card is None:
+        raise RuntimeError(f"Failed to resolve agent card from {agent_url}")
 
-        client = A2AClient(httpx_client=httpx_client, agent_card=card)
+    client = A2AClient(httpx_client=_get_client(), agent_card=card)
 
-        # Create message request
-        params = MessageSendParams(
-            message=Message(
-                role=Role.user,
-                parts=[Part(TextPart(text=message))],
-                messageId=uuid4().hex,
-                taskId=None,
-            )
+    # Create message request
+    params = MessageSendParams(
+        message=Message(
+            role=Role.user,
+            parts=[Part(TextPart(text=message))],
+            messageId=uuid4().hex,
+            taskId=None,
         )
-        req = SendStreamingMessageRequest(id=str(uuid4()), params=params)
+    )
+    req = SendStreamingMessageRequest(id=str(uuid4()), params=params)
 
-        # Collect response chunks
-        chunks: List[str] = []
+    # Collect response chunks. Exact type checks bound to locals keep the
+    # per-event cost low; none of these a2a types are subclassed.
+    buf = io.StringIO()
+    success_t = SendStreamingMessageSuccessResponse
+    artifact_t = TaskArtifactUpdateEvent
+    status_t = TaskStatusUpdateEvent
+    text_t = TextPart
 
-        async for chunk in client.send_message_streaming(req):
-            if not isinstance(chunk.root, SendStreamingMessageSuccessResponse):
+    try:
+        async for chunk in client.send_message_streaming(
+            req, http_kwargs={"timeout": timeout}
+        ):
+            root = chunk.root
+            if type(root) is not success_t:
                 continue
-            event = chunk.root.result
-            if isinstance(event, TaskArtifactUpdateEvent):
-                for p in event.artifact.parts:
-                    if isinstance(p.root, TextPart):
-                        chunks.append(p.root.text)
-            elif isinstance(event, TaskStatusUpdateEvent):
-                msg = event.status.message
-                if msg:
-                    for p in msg.parts:
-                        if isinstance(p.root, TextPart):
-                            chunks.append(p.root.text)
-
-        response = "".join(chunks).strip() or "No response from agent."
+            event = root.result
+            event_t = type(event)
+            if event_t is artifact_t:
+                parts = event.artifact.parts
+            elif event_t is status_t and event.status.message:
+                parts = event.status.message.parts
+            else:
+                continue
+            for p in parts:
+                if type(p.root) is text_t:
+                    buf.write(p.root.text)
+    except Exception:
+        # The agent may have restarted with a new card; re-resolve next time
+        _card_cache.pop(agent_url, None)
+        raise
 
-        return response
+    response = buf.getvalue().strip() or "No response from agent."
 
-    finally:
-        # Clean up the httpx client to prevent resource leaks
-        if httpx_client:
-            await httpx_client.aclose()
+    return response
 
 
 async def check_agent_health(agent_url: str, timeout: float | None = None) -> bool:
@@ -115,17 +176,12 @@ async def check_agent_health(agent_url: str, timeout: float | None = None) -> bo
     if timeout is None:
         timeout = settings.a2a_health_check_timeout
 
-    httpx_client = None
     try:
-        httpx_client = httpx.AsyncClient(timeout=timeout)
-        resolver = A2ACardResolver(httpx_client=httpx_client, base_url=agent_url)
-        agent_card = await resolver.get_agent_card()
+        # Always probe the agent; a successful probe refreshes the card cache
+        agent_card = await _fetch_card(agent_url, timeout)
         return agent_card is not None
     except Exception:
         return False
-    finally:
-        if httpx_client:
-            await httpx_client.aclose()
 
 
 async def get_agent_card(agent_url: str, timeout: float | None = None) -> dict | None:
@@ -143,12 +199,8 @@ async def get_agent_card(agent_url: str, timeout: float | None = None) -> dict |
     if timeout is None:
         timeout = settings.a2a_health_check_timeout
 
-    httpx_client = None
     try:
-        httpx_client = httpx.AsyncClient(timeout=timeout)
-        resolver = A2ACardResolver(httpx_client=httpx_client, base_url=agent_url)
-
-        agent_card = await resolver.get_agent_card()
+        agent_card = _cached_card(agent_url) or await _fetch_card(agent_url, timeout)
 
         if agent_card:
             return agent_card.model_dump(exclude_none=True)
@@ -156,6 +208,3 @@ async def get_agent_card(agent_url: str, timeout: float | None = None) -> dict |
             return None
     except Exception:
         return None
-    finally:
-        if httpx_client:
-            await httpx_client.aclose()
@@ -0,0 +1,106 @@
+"""
+Tests for the task MCP server's persistent container shell.
+
+A fake `docker` on PATH runs `docker exec ... container cmd` locally, so the
+shell framing is exercised without a real container.
+"""
+
+import asyncio
+import os
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.green_agent.task_mcp_server import _OUTPUT_CAP, TaskMCPServer
+
+FAKE_DOCKER = """#!/bin/bash
+# docker exec [-i] [-w dir] container cmd...
+shift
+while [[ "$1" == -* ]]; do
+  case "$1" in
+    -w) cd "$WORKDIR"; shift 2;;
+    *) shift;;
+  esac
+done
+shift
+exec "$@"
+"""
+
+
+class TestPersistentShell(unittest.IsolatedAsyncioTestCase):
+    """Test command framing on the persistent shell."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        bin_dir = Path(self.tmp.name) / "bin"
+        bin_dir.mkdir()
+        docker = bin_dir / "docker"
+        docker.write_text(FAKE_DOCKER)
+        docker.chmod(docker.stat().st_mode | stat.S_IEXEC)
+        path = f"{bin_dir}{os.pathsep}{os.environ['PATH']}"
+        env = patch.dict(os.environ, {"PATH": path, "WORKDIR": self.tmp.name})
+        env.start()
+        self.addCleanup(env.stop)
+        self.addCleanup(self.tmp.cleanup)
+        self.server = TaskMCPServer("test-container", 0)
+
+    async def asyncTearDown(self):
+        self.server._discard_shell()
+
+    async def test_command_output_and_returncode(self):
+        """Test stdout, stderr and exit status are framed per command."""
+        result = await self.server._execute_bash_command(
+            "echo out; echo err >&2; exit 3"
+        )
+
+        self.assertEqual(result["stdout"], "out\n")
+        self.assertEqual(result["stderr"], "err\n")
+        self.assertEqual(result["returncode"], 3)
+
+    async def test_long_output_keeps_head_and_tail(self):
+        """Test output over the cap is cut in the middle with a notice."""
+        result = await self.server._execute_bash_command(
+            "head -c 5000000 /dev/zero | tr '\\0' a; echo end; exit 7"
+        )
+        stdout = result["stdout"]
+
+        self.assertGreaterEqual(len(stdout), _OUTPUT_CAP)
+        self.assertLess(len(stdout), _OUTPUT_CAP + 100)
+        self.assertRegex(stdout, r"\n\.\.\.\[\d+ bytes truncated\]\.\.\.\n")
+        self.assertTrue(stdout.startswith("aaaa"))
+        self.assertTrue(stdout.endswith("end\n"))
+        self.assertEqual(result["returncode"], 7)
+
+    async def test_background_output_does_not_leak(self):
+        """Test a background job's late output is not returned by later calls."""
+        first = await self.server._execute_bash_command(
+            "(sleep 0.3; echo late; echo late >&2) & echo now"
+        )
+        await asyncio.sleep(0.6)
+        second = await self.server._execute_bash_command("echo after")
+
+        self.assertEqual(first["stdout"], "now\n")
+        self.assertEqual(second["stdout"], "after\n")
+        self.assertEqual(second["stderr"], "")
+
+    async def test_chatty_background_job_keeps_running(self):
+        """Test a background job is not blocked by output nobody asked for."""
+        done = Path(self.tmp.name) / "done"
+        await self.server._execute_bash_command(
+            f"(for i in $(seq 100000); do echo spam; echo spam >&2; done; "
+            f"touch {done}) &"
+        )
+        for _ in range(100):
+            if done.exists():
+                break
+            await asyncio.sleep(0.1)
+
+        self.assertTrue(done.exists())
+        result = await self.server._execute_bash_command("echo mine")
+        self.assertEqual(result["stdout"], "mine\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+Tests for the white agent's LLM/MCP tool loop.
+
+The Chat Completions API is faked with an httpx mock transport that streams
+scripted turns, and the MCP session with an in-process object.
+"""
+
+import asyncio
+import json
+import unittest
+
+import httpx
+from mcp.types import CallToolResult, ListToolsResult, TextContent, Tool
+from openai import AsyncOpenAI
+
+from white_agent.white_agent_helpers import solve_task_with_llm_and_mcp
+
+TOOL = "execute_bash_command"
+
+
+def _chunk(delta: dict, finish_reason: str | None = None) -> str:
+    body = {
+        "id": "chatcmpl-test",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "test-model",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    return f"data: {json.dumps(body)}\n\n"
+
+
+def _stream(content: str, calls: list[tuple[str, str]]) -> bytes:
+    """Build an SSE completion from text and (call id, raw arguments) pairs."""
+    events = [_chunk({"role": "assistant", "content": content})]
+    for index, (call_id, arguments) in enumerate(calls):
+        events.append(
+            _chunk(
+                {
+                    "tool_calls": [
+                        {
+                            "index": index,
+                            "id": call_id,
+                            "type": "function",
+                            "function": {"name": TOOL, "arguments": ""},
+                        }
+                    ]
+                }
+            )
+        )
+        # Arguments arrive in pieces, as they do from the real API
+        for i in range(0, len(arguments), 4):
+            piece = {"index": index, "function": {"arguments": arguments[i : i + 4]}}
+            events.append(_chunk({"tool_calls": [piece]}))
+    events.append(_chunk({}, "tool_calls" if calls else "stop"))
+    events.append("data: [DONE]\n\n")
+    return "".join(events).encode()
+
+
+def _fake_client(turns: list[bytes], requests: list[dict]) -> AsyncOpenAI:
+    """Return a client that answers each request with the next scripted turn."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            content=turns.pop(0),
+            headers={"content-type": "text/event-stream"},
+        )
+
+    return AsyncOpenAI(
+        api_key="test",
+        base_url="http://llm.test/v1",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+class FakeSession:
+    """MCP session whose bash tool echoes the command back."""
+
+    def __init__(self, delays: dict[str, float] | None = None):
+        self.delays = delays or {}
+        self.calls: list[str] = []
+
+    async def list_tools(self) -> ListToolsResult:
+        schema = {"type": "object", "properties": {"command": {"type": "string"}}}
+        return ListToolsResult(
+            tools=[Tool(name=TOOL, description="Run bash", inputSchema=schema)]
+        )
+
+    async def call_tool(self, name: str, arguments: dict) -> CallToolResult:
+        command = arguments["command"]
+        self.calls.append(command)
+        await asyncio.sleep(self.delays.get(command, 0))
+        result = {
+            "command": command,
+            "returncode": 0,
+            "stdout": f"{command}\n",
+            "stderr": "",
+        }
+        text = json.dumps(result)
+        return CallToolResult(content=[TextContent(type="text", text=text)])
+
+
+class TestSolveTask(unittest.IsolatedAsyncioTestCase):
+    """Test the streamed tool loop against a scripted model."""
+
+    async def test_tool_turn_round_trip(self):
+        """Test the assistant turn, tool result order and malformed arguments."""
+        requests: list[dict] = []
+        client = _fake_client(
+            [
+                _stream(
+                    "",
+                    [
+                        ("call_0", '{"command": "slow"}'),
+                        ("call_1", '{"command": "fast"}'),
+                        ("call_2", '{"command": "trunc'),
+                    ],
+                ),
+                _stream("All done.", []),
+            ],
+            requests,
+        )
+        # The first call finishes last, so results arrive out of call order
+        session = FakeSession(delays={"slow": 0.1})
+
+        answer = await solve_task_with_llm_and_mcp(
+            "do it", session, client, "test-model", max_iterations=5
+        )
+
+        self.assertEqual(answer, "All done.")
+        self.assertEqual(session.calls, ["slow", "fast"])
+        self.assertEqual(len(requests), 2)
+
+        messages = requests[1]["messages"]
+        assistant = messages[2]
+        self.assertEqual(assistant["role"], "assistant")
+        self.assertLessEqual(set(assistant), {"role", "content", "tool_calls"})
+        for tool_call in assistant["tool_calls"]:
+            self.assertEqual(set(tool_call), {"id", "type", "function"})
+            self.assertEqual(set(tool_call["function"]), {"name", "arguments"})
+
+        tool_messages = messages[3:]
+        self.assertEqual(
+            [m["tool_call_id"] for m in tool_messages], ["call_0", "call_1", "call_2"]
+        )
+        self.assertIn("Output:\nslow\n", tool_messages[0]["content"])
+        self.assertIn("Output:\nfast\n", tool_messages[1]["content"])
+        self.assertTrue(tool_messages[2]["content"].startswith("Error:"))
+
+    async def _run_repeating(self, max_iterations: int) -> tuple[str, list[dict]]:
+        """Repeat one call three times, then answer the tool-less turn."""
+        requests: list[dict] = []
+        repeat = _stream("", [("call_0", '{"command": "ls"}')])
+        client = _fake_client(
+            [repeat, repeat, repeat, _stream("Summary.", [])], requests
+        )
+        answer = await solve_task_with_llm_and_mcp(
+            "do it", FakeSession(), client, "test-model", max_iterations
+        )
+        return answer, requests
+
+    async def test_repeated_call_ends_with_summary(self):
+        """Test a repeated identical call leads to a tool-less summary turn."""
+        answer, requests = await self._run_repeating(max_iterations=5)
+
+        self.assertEqual(answer, "Summary.")
+        self.assertEqual(len(requests), 4)
+        self.assertIn("tools", requests[2])
+        self.assertNotIn("tools", requests[3])
+        self.assertEqual(requests[3]["messages"][-1]["role"], "system")
+
+    async def test_repeat_on_last_iteration_still_summarizes(self):
+        """Test the summary turn runs when the guard trips on the last iteration."""
+        answer, requests = await self._run_repeating(max_iterations=3)
+
+        self.assertEqual(answer, "Summary.")
+        self.assertEqual(len(requests), 4)
+        self.assertNotIn("tools", requests[3])
+
+
+if __name__ == "__main__":
+    unittest.main()
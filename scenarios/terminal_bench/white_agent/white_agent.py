@@ -1,9 +1,7 @@
 """LLM-powered white agent using MCP tools for terminal-bench evaluation."""
 
 import logging
-import re
 import uvicorn
-from openai import OpenAI
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.tasks import InMemoryTaskStore, TaskUpdater
 from a2a.server.request_handlers import DefaultRequestHandler
@@ -18,8 +16,21 @@ from a2a.types import (
     TaskState,
 )
 from a2a.utils import new_task, new_agent_text_message
+from a2a.utils.constants import (
+    AGENT_CARD_WELL_KNOWN_PATH,
+    PREV_AGENT_CARD_WELL_KNOWN_PATH,
+)
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
 from src.config import settings
-from white_agent.white_agent_helpers import connect_to_mcp, solve_task_with_llm_and_mcp
+from white_agent.white_agent_helpers import (
+    MCP_URL_RE,
+    connect_to_mcp,
+    get_openai_client,
+    solve_task_with_llm_and_mcp,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +39,6 @@ class LLMWhiteAgentExecutor(AgentExecutor):
     """White agent that uses MCP tools to solve tasks."""
 
     def __init__(self):
-        self.client = OpenAI(api_key=settings.openai_api_key)
         self.model = settings.white_agent_model
 
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
@@ -46,11 +56,11 @@ class LLMWhiteAgentExecutor(AgentExecutor):
         try:
             # Extract MCP server URL from user input
             user_input = context.get_user_input()
-            mcp_match = re.search(r"MCP Server URL: (.+)", user_input)
+            mcp_match = MCP_URL_RE.search(user_input)
             if not mcp_match:
                 raise ValueError("MCP Server URL not found")
 
-            mcp_url = mcp_match.group(1).strip()
+            mcp_url = mcp_match.group(1)
             logger.info(f"MCP: {mcp_url}")
 
             # Connect to MCP server and solve task
@@ -58,7 +68,7 @@ class LLMWhiteAgentExecutor(AgentExecutor):
                 response = await solve_task_with_llm_and_mcp(
                     user_input,
                     mcp_session,
-                    self.client,
+                    get_openai_client(settings.openai_api_key),
                     self.model,
                     settings.agent_max_iterations,
                 )
@@ -104,16 +114,28 @@ def prepare_white_agent_card(url: str) -> AgentCard:
     )
 
 
-def create_llm_white_agent_app(url: str) -> A2AStarletteApplication:
+def create_llm_white_agent_app(url: str) -> Starlette:
     """Create A2A application."""
-    return A2AStarletteApplication(
-        agent_card=prepare_white_agent_card(url),
+    card = prepare_white_agent_card(url)
+    app = A2AStarletteApplication(
+        agent_card=card,
         http_handler=DefaultRequestHandler(
             agent_executor=LLMWhiteAgentExecutor(),
             task_store=InMemoryTaskStore(),
         ),
     ).build()
 
+    # The card never changes, so serve it pre-encoded ahead of the a2a routes,
+    # which re-serialize the pydantic model on every request
+    card_json = card.model_dump_json(exclude_none=True, by_alias=True).encode()
+
+    async def get_card(request: Request) -> Response:
+        return Response(card_json, media_type="application/json")
+
+    for path in (AGENT_CARD_WELL_KNOWN_PATH, PREV_AGENT_CARD_WELL_KNOWN_PATH):
+        app.router.routes.insert(0, Route(path, get_card, methods=["GET"]))
+    return app
+
 
 def main():
     """Main entry point."""
@@ -1,14 +1,99 @@
 """Helper for solving tasks using LLM with MCP tools."""
 
-import json
+import asyncio
 import logging
+import re
+import weakref
 from typing import Any
-from openai import OpenAI
+import httpx
+import orjson
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from mcp import ClientSession
 from mcp.client.sse import sse_client
+from openai.types.chat import ChatCompletionMessage
 
 logger = logging.getLogger(__name__)
 
+# How a task message gives the URL of its task's MCP server
+MCP_URL_RE = re.compile(r"MCP Server URL:\s*(\S+)")
+
+# Shared OpenAI clients, one per event loop; httpx connections cannot cross loops
+_openai_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# The task MCP server pings its SSE stream every 15 s, so a minute of silence
+# means it is gone; POSTs to it are local and answer immediately
+_MCP_HTTP_TIMEOUT = 5.0
+_MCP_SSE_READ_TIMEOUT = 60.0
+
+# A tool call whose arguments are longer than this is decoded off the event loop
+_OFFLOAD_PARSE_CHARS = 64 * 1024
+
+# Assistant message fields Chat Completions does not take back as input;
+# `index` and `parsed` are added by the SDK's stream accumulator
+_RESPONSE_ONLY_FIELDS = {
+    "refusal": True,
+    "annotations": True,
+    "audio": True,
+    "function_call": True,
+    "parsed": True,
+    "tool_calls": {"__all__": {"index"}},
+}
+
+# Kept constant, with tools in a stable order, so every request of a task
+# shares the same prompt prefix and can hit the provider's prompt cache
+SYSTEM_PROMPT = """You are a helpful assistant being evaluated on Terminal-Bench.
+
+Your goal is to complete terminal tasks by executing bash commands.
+
+Guidelines:
+- Break down complex tasks into simple steps
+- Execute one command at a time and check the result
+- If a command fails, analyze the error and try a different approach
+- Check previous tool results before running a command; only re-run it if the output is unavailable or may have changed
+- When complete, provide a clear summary
+- Be concise but thorough"""
+
+# An identical tool call returning the identical result this many times ends
+# tool use: the next turn is sent without tools and its answer is returned
+_MAX_REPEATED_CALLS = 3
+_REPEAT_NOTICE = {
+    "role": "system",
+    "content": (
+        "You have made the same tool call with the same result "
+        f"{_MAX_REPEATED_CALLS} times. Stop calling tools and summarize what "
+        "was done and what remains."
+    ),
+}
+
+# Shared by every conversation; message dicts are never mutated once appended
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+
+def get_openai_client(api_key: str | None) -> AsyncOpenAI:
+    """Return the shared AsyncOpenAI client for the running event loop.
+
+    Use this instead of creating a client per task: concurrent tasks then
+    multiplex their requests over the same HTTP/2 connections.
+    """
+    loop = asyncio.get_running_loop()
+    client = _openai_clients.get(loop)
+    if client is None or client.is_closed():
+        client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=64,
+                    keepalive_expiry=120,
+                ),
+            ),
+        )
+        _openai_clients[loop] = client
+    return client
+
 
 class MCPConnection:
     """Context manager for MCP connections with proper cleanup."""
@@ -23,17 +108,17 @@ class MCPConnection:
     async def __aenter__(self) -> ClientSession:
         """Connect to MCP server."""
         sse_url = f"{self.mcp_url}/sse"
-        logger.info(f"Connecting to {sse_url}")
+        logger.info("Connecting to %s", sse_url)
 
-        self.sse_context = sse_client(sse_url)
+        self.sse_context = sse_client(
+            sse_url, timeout=_MCP_HTTP_TIMEOUT, sse_read_timeout=_MCP_SSE_READ_TIMEOUT
+        )
         self.read_stream, self.write_stream = await self.sse_context.__aenter__()
 
         self.session = ClientSession(self.read_stream, self.write_stream)
         await self.session.__aenter__()
         await self.session.initialize()
-
-        tools = await self.session.list_tools()
-        logger.info(f"Connected. Tools: {[t.name for t in tools.tools]}")
+        logger.info("Connected")
 
         return self.session
 
@@ -43,13 +128,13 @@ class MCPConnection:
             try:
                 await self.session.__aexit__(exc_type, exc_val, exc_tb)
             except Exception as e:
-                logger.warning(f"Session close error: {e}")
+                logger.warning("Session close error: %s", e)
 
         if self.sse_context:
             try:
                 await self.sse_context.__aexit__(exc_type, exc_val, exc_tb)
             except Exception as e:
-                logger.warning(f"SSE close error: {e}")
+                logger.warning("SSE close error: %s", e)
 
         logger.info("MCP closed")
 
@@ -70,7 +155,7 @@ def convert_mcp_tools_to_openai(tools_result) -> list[dict]:
                 "parameters": tool.inputSchema,
             },
         }
-        for tool in tools_result.tools
+        for tool in sorted(tools_result.tools, key=lambda t: t.name)
     ]
 
 
@@ -78,104 +163,160 @@ async def call_mcp_tool(
     session: ClientSession, tool_name: str, arguments: dict
 ) -> dict[str, Any]:
     """Call MCP tool and return result."""
-    logger.debug(f"Calling {tool_name}: {arguments}")
+    logger.debug("Calling %s: %s", tool_name, arguments)
 
     result = await session.call_tool(tool_name, arguments=arguments)
 
     if result.content and len(result.content) > 0:
-        return json.loads(result.content[0].text)
+        return orjson.loads(result.content[0].text)
     return {"error": "No result from MCP server"}
 
 
+def _truncate(s: str, head: int = 2000, tail: int = 1000) -> str:
+    """Keep the head and tail of long tool output for the message history."""
+    if len(s) < head + tail + 100:
+        return s
+    return f"{s[:head]}\n...[{len(s) - head - tail} characters elided]...\n{s[-tail:]}"
+
+
+def _parse_tool_args(arguments: str) -> dict | Exception:
+    """Decode a tool call's JSON arguments, returning the error if malformed."""
+    try:
+        return orjson.loads(arguments)
+    except orjson.JSONDecodeError as e:
+        return e
+
+
+async def _decode_tool_args(arguments: str) -> dict | Exception:
+    """Decode tool call arguments, off the event loop when they are large."""
+    if len(arguments) > _OFFLOAD_PARSE_CHARS:
+        return await asyncio.to_thread(_parse_tool_args, arguments)
+    return _parse_tool_args(arguments)
+
+
+async def _run_tool_call(
+    session: ClientSession, tool_call, fn_args: dict | Exception
+) -> dict[str, Any]:
+    """Run one LLM tool call, reporting failures as an error result."""
+    try:
+        if isinstance(fn_args, Exception):
+            raise fn_args
+        fn_name = tool_call.function.name
+        logger.info("Tool: %s | Args: %s", fn_name, fn_args)
+
+        result = await call_mcp_tool(session, fn_name, fn_args)
+        logger.debug("Result: %s", result)
+        return result
+    except Exception as e:
+        logger.warning("Tool call %s failed: %s", tool_call.id, e)
+        return {"error": str(e)}
+
+
+async def _stream_turn(
+    openai_client: AsyncOpenAI, session: ClientSession, **request
+) -> tuple[ChatCompletionMessage, list[asyncio.Task]]:
+    """Stream one completion, starting each tool call as soon as it is complete.
+
+    Returns the assistant message and one task per tool call, in call order.
+    Calls are started in that order too, so the MCP server runs them in order.
+    """
+    tasks: list[asyncio.Task] = []
+
+    async def start(tool_call) -> None:
+        args = await _decode_tool_args(tool_call.function.arguments)
+        tasks.append(asyncio.create_task(_run_tool_call(session, tool_call, args)))
+
+    try:
+        async with openai_client.chat.completions.stream(**request) as stream:
+            async for event in stream:
+                if event.type == "tool_calls.function.arguments.done":
+                    snapshot = stream.current_completion_snapshot.choices[0].message
+                    await start(snapshot.tool_calls[event.index])
+            completion = await stream.get_final_completion()
+        message = completion.choices[0].message
+        # Calls the stream never closed out, e.g. when cut off by max tokens
+        for tool_call in (message.tool_calls or [])[len(tasks) :]:
+            await start(tool_call)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    return message, tasks
+
+
 async def solve_task_with_llm_and_mcp(
     user_input: str,
     mcp_session: ClientSession,
-    openai_client: OpenAI,
+    openai_client: AsyncOpenAI,
     model: str,
     max_iterations: int = 10,
 ) -> str:
     """Solve task using LLM with MCP tools."""
-    tools_result = await mcp_session.list_tools()
-    openai_tools = convert_mcp_tools_to_openai(tools_result)
-    logger.info(f"Using {len(openai_tools)} MCP tools")
-
-    messages = [
-        {
-            "role": "system",
-            "content": """You are a helpful assistant being evaluated on Terminal-Bench.
-
-Your goal is to complete terminal tasks by executing bash commands.
-
-Guidelines:
-- Break down complex tasks into simple steps
-- Execute one command at a time and check the result
-- If a command fails, analyze the error and try a different approach
-- When complete, provide a clear summary
-- Be concise but thorough""",
-        },
-        {"role": "user", "content": user_input},
-    ]
-
-    for iteration in range(1, max_iterations + 1):
-        logger.info(f"=== Iteration {iteration}/{max_iterations} ===")
-
-        response = openai_client.chat.completions.create(
-            model=model, messages=messages, tools=openai_tools, tool_choice="auto"
+    # Listed once per session: the server's tools are fixed for its lifetime
+    openai_tools = convert_mcp_tools_to_openai(await mcp_session.list_tools())
+    logger.info("MCP tools: %s", [t["function"]["name"] for t in openai_tools])
+
+    messages = [_SYSTEM_MESSAGE, {"role": "user", "content": user_input}]
+    # (tool name, raw arguments, formatted result) -> times seen
+    seen_calls: dict[tuple[str, str, str], int] = {}
+    summarize = False
+
+    for iteration in range(1, max_iterations + 2):
+        # The extra turn is only for a summary asked for on the last iteration
+        if iteration > max_iterations and not summarize:
+            break
+        logger.info("=== Iteration %d/%d ===", iteration, max_iterations)
+
+        request = {"model": model, "messages": messages}
+        if not summarize:
+            request["tools"] = openai_tools
+            request["tool_choice"] = "auto"
+        assistant_msg, tool_tasks = await _stream_turn(
+            openai_client, mcp_session, **request
         )
-
-        assistant_msg = response.choices[0].message
+        content = assistant_msg.content
+        tool_calls = assistant_msg.tool_calls
         logger.info(
-            f"LLM: {assistant_msg.content[:200] if assistant_msg.content else 'None'} | "
-            f"Tools: {len(assistant_msg.tool_calls) if assistant_msg.tool_calls else 0}"
+            "LLM: %s | Tools: %d",
+            content[:200] if content else None,
+            len(tool_calls) if tool_calls else 0,
         )
 
+        # Response-only fields are dropped; the rest is the exact input shape
         messages.append(
-            {
-                "role": "assistant",
-                "content": assistant_msg.content,
-                "tool_calls": (
-                    [
-                        {
-                            "id": tc.id,
-                            "type": tc.type,
-                            "function": {
-                                "name": tc.function.name,
-                                "arguments": tc.function.arguments,
-                            },
-                        }
-                        for tc in assistant_msg.tool_calls
-                    ]
-                    if assistant_msg.tool_calls
-                    else None
-                ),
-            }
+            assistant_msg.model_dump(exclude_none=True, exclude=_RESPONSE_ONLY_FIELDS)
         )
 
-        if not assistant_msg.tool_calls:
+        if not tool_calls:
             logger.info("No tool calls. Done.")
-            return assistant_msg.content or "Task completed."
-
-        logger.info(f"Executing {len(assistant_msg.tool_calls)} tool(s)")
-        for tool_call in assistant_msg.tool_calls:
-            fn_name = tool_call.function.name
-            fn_args = json.loads(tool_call.function.arguments)
-            logger.info(f"Tool: {fn_name} | Args: {fn_args}")
-
-            result = await call_mcp_tool(mcp_session, fn_name, fn_args)
-            logger.debug(f"Result: {result}")
+            return content or "Task completed."
 
+        logger.info("Executing %d tool(s)", len(tool_calls))
+        results = await asyncio.gather(*tool_tasks)
+        for tool_call, result in zip(tool_calls, results):
             if "error" in result:
                 result_msg = f"Error: {result['error']}"
             else:
                 result_msg = f"Command: {result.get('command', 'N/A')}\n"
                 result_msg += f"Exit code: {result.get('returncode', 'N/A')}\n"
                 if result.get("stdout"):
-                    result_msg += f"Output:\n{result['stdout']}"
+                    result_msg += f"Output:\n{_truncate(result['stdout'])}"
                 if result.get("stderr"):
-                    result_msg += f"Error:\n{result['stderr']}"
+                    result_msg += f"Error:\n{_truncate(result['stderr'])}"
 
             messages.append(
                 {"role": "tool", "tool_call_id": tool_call.id, "content": result_msg}
             )
 
+            tc_fn = tool_call.function
+            call_key = (tc_fn.name, tc_fn.arguments, result_msg)
+            seen_calls[call_key] = seen_calls.get(call_key, 0) + 1
+            if seen_calls[call_key] >= _MAX_REPEATED_CALLS:
+                summarize = True
+
+        if summarize:
+            # The model is looping; take the tools away so the next turn concludes
+            logger.warning("Repeated identical tool call; asking for a summary")
+            messages.append(_REPEAT_NOTICE)
+
     return "Task completed (reached iteration limit)."